@@ -52,9 +52,13 @@ class CurveFitting:
         self.data_summary = None
     
     def run(self, use_refinement: bool = True,
-            de_maxiter: int = 2000,
-            de_popsize: int = 17,
-            de_tol: float = 1e-6,
+            de_maxiter: int = 300,
+            de_popsize: int = 12,
+            de_tol: float = 1e-4,
+            vectorized: bool = True,
+            de_precision: str = 'float32',
+            coarse_to_fine: bool = True,
+            refine_method: str = 'Nelder-Mead',
             plot_path: str = 'fit_plot.png',
             results_path: str = 'results.txt') -> Tuple[float, float, float, float]:
         """
@@ -81,7 +85,11 @@ class CurveFitting:
             use_refinement=use_refinement,
             de_maxiter=de_maxiter,
             de_popsize=de_popsize,
-            de_tol=de_tol
+            de_tol=de_tol,
+            vectorized=vectorized,
+            de_precision=de_precision,
+            coarse_to_fine=coarse_to_fine,
+            refine_method=refine_method
         )
         
         # Step 3: Generate visualization
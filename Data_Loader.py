@@ -2,11 +2,16 @@
 Data Loader Module - Handles loading and preprocessing of observed data points.
 """
 
-import pandas as pd
+import csv
+import warnings
 import numpy as np
 from typing import Tuple
 
 
+class _EmptyCSVError(Exception):
+    """Raised when the CSV file has no header line."""
+
+
 class DataLoader:
 
     def __init__(self, csv_path: str = 'xy_data.csv', t_min: float = 6.0, t_max: float = 60.0):
@@ -27,14 +32,25 @@ class DataLoader:
         
         """    
         try:
-            df = pd.read_csv(self.csv_path)
+            # header only, to validate and locate the columns
+            with open(self.csv_path, newline='') as f:
+                header = [name.strip() for name in next(csv.reader(f), [])]
+            
+            if not header:
+                raise _EmptyCSVError()
             
-            if 'x' not in df.columns or 'y' not in df.columns:
+            if 'x' not in header or 'y' not in header:
                 raise ValueError(f"CSV file must contain 'x' and 'y' columns")
             
+            # a header-only file gives an empty array (reported below) plus a
+            # loadtxt UserWarning that would otherwise leak to the caller
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                data = np.loadtxt(self.csv_path, delimiter=',', skiprows=1, dtype=np.float64,
+                                  usecols=(header.index('x'), header.index('y')), ndmin=2)
             
-            self.x_obs = df['x'].values.astype(float)
-            self.y_obs = df['y'].values.astype(float)
+            self.x_obs = np.ascontiguousarray(data[:, 0])
+            self.y_obs = np.ascontiguousarray(data[:, 1])
             self.n_points = len(self.x_obs)
             
             # consistency checking
@@ -55,7 +71,7 @@ class DataLoader:
             
         except FileNotFoundError:
             raise FileNotFoundError(f"Error: Could not find {self.csv_path}")
-        except pd.errors.EmptyDataError:
+        except _EmptyCSVError:
             raise ValueError(f"Error: {self.csv_path} is empty")
         except Exception as e:
             raise ValueError(f"Error loading data: {e}")
@@ -3,10 +3,65 @@ Loss Function Modulec - Implements loss functions for optimization.
 """
 
 import numpy as np
+from numba import njit, prange
 from typing import Tuple
 from ParametricModel import ParametricModel
 
 
+@njit(fastmath=True, cache=True, boundscheck=False)
+def _closest_l1(x_curve, y_curve, x_i, y_i):
+    """
+    Minimum of |x_curve - x_i| + |y_curve - y_i| over a non-empty curve.
+    
+    Seeded from the first point rather than inf: fastmath implies 'ninf',
+    which makes comparisons against infinity undefined.
+    """
+    best = abs(x_curve[0] - x_i) + abs(y_curve[0] - y_i)
+    for j in range(1, x_curve.size):
+        d = abs(x_curve[j] - x_i) + abs(y_curve[j] - y_i)
+        if d < best:
+            best = d
+    return best
+
+
+@njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+def l1_loss_fused(x_curve, y_curve, x_obs, y_obs):
+    """
+    Mean closest-point L1 distance without building the (N_obs, T) matrix.
+    
+    Each observation scans the curve (length T) for its minimum distance,
+    in parallel over observations.
+    """
+    n_obs = x_obs.size
+    acc = 0.0
+    for i in prange(n_obs):
+        acc += _closest_l1(x_curve, y_curve, x_obs[i], y_obs[i])
+    
+    return acc / n_obs
+
+
+@njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+def l1_min_distances(x_curve, y_curve, x_obs, y_obs, out):
+    """
+    Per-observation closest-point L1 distance, written into out (length N_obs).
+    """
+    for i in prange(x_obs.size):
+        out[i] = _closest_l1(x_curve, y_curve, x_obs[i], y_obs[i])
+
+
+@njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+def l1_loss_batch(x_curves, y_curves, x_obs, y_obs, out):
+    """
+    Mean closest-point L1 distance for each row of (S, T) curves, into out (length S).
+    """
+    n_obs = x_obs.size
+    for s in prange(x_curves.shape[0]):
+        acc = 0.0
+        for i in range(n_obs):
+            acc += _closest_l1(x_curves[s], y_curves[s], x_obs[i], y_obs[i])
+        out[s] = acc / n_obs
+
+
 class L1Loss:
     """
     Computes L1 loss: sum(|x_pred - x_obs| + |y_pred - y_obs|)
@@ -16,36 +71,109 @@ class L1Loss:
     def __init__(self, model: ParametricModel):
 
         self.model = model
+        self._dtype = np.dtype(np.float64)
+        self._t = None
+        # curve-independent terms of the model, fixed once t is bound
+        self._abs_t = None
+        self._sin_ft = None
+        self._x_obs = None
+        self._y_obs = None
+        # (x, y) curve buffers reused by predict_cached across evaluations
+        self._x_curve = None
+        self._y_curve = None
     
-    def compute(self, params: np.ndarray, t_grid: np.ndarray, 
-                x_obs: np.ndarray, y_obs: np.ndarray) -> float:
+    def bind(self, t_grid: np.ndarray, x_obs: np.ndarray, y_obs: np.ndarray,
+             precision: str = 'float64') -> None:
         """
-        Compute MEAN L1 loss using the closest point matching approach.
+        Bind the curve grid and observed points once before optimization.
         
         Args:
-            params: [theta_deg, m, x]
             t_grid: A finely discretized array of t values [6, 60] representing the predicted curve.
             x_obs, y_obs: Observed data points.
-            
-        Returns: Total L1 loss.
+            precision: 'float64', or 'float32' for a faster but coarser search phase.
+        """
+        if precision not in ('float32', 'float64'):
+            raise ValueError(f"precision must be 'float32' or 'float64', got {precision!r}")
+        
+        self._dtype = np.dtype(precision)
+        t_grid = np.asarray(t_grid, dtype=np.float64)
+        
+        # the kernels index the first curve point and divide by N_obs
+        if t_grid.size == 0 or len(x_obs) == 0:
+            raise ValueError("t_grid and observed points must be non-empty")
+        if len(x_obs) != len(y_obs):
+            raise ValueError("Number of x and y values must be equal")
+        
+        # |t| and sin(freq*t) are computed in float64 before the downcast
+        self._t = np.ascontiguousarray(t_grid, dtype=self._dtype)
+        self._abs_t = np.ascontiguousarray(np.abs(t_grid), dtype=self._dtype)
+        self._sin_ft = np.ascontiguousarray(np.sin(self.model.frequency * t_grid), dtype=self._dtype)
+        self._x_obs = np.ascontiguousarray(x_obs, dtype=self._dtype)
+        self._y_obs = np.ascontiguousarray(y_obs, dtype=self._dtype)
+        self._x_curve = np.empty_like(self._t)
+        self._y_curve = np.empty_like(self._t)
+    
+    def _predict_curve(self, params: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Curve for params on the bound grid, written into the reused buffers.
         """
+        if self._t is None:
+            raise ValueError("Data not bound. Call bind() first.")
+        
         theta_deg, m, x = params
         
-        x_curve, y_curve = self.model.predict(t_grid, theta_deg, m, x)
+        return self.model.predict_cached(self._t, self._abs_t, self._sin_ft, theta_deg, m, x,
+                                         out=(self._x_curve, self._y_curve))
+    
+    def compute(self, params: np.ndarray) -> float:
+        """
+        Compute MEAN L1 loss using the closest point matching approach.
+        
+        Args:
+            params: [theta_deg, m, x]
+            
+        Returns: Total L1 loss.
+        """
+        x_curve, y_curve = self._predict_curve(params)
         
-        N_obs = len(x_obs)
-        total_min_l1_distance = 0.0
+        return float(l1_loss_fused(x_curve, y_curve, self._x_obs, self._y_obs))
+    
+    def compute_batch(self, params: np.ndarray) -> np.ndarray:
+        """
+        Compute MEAN L1 loss for a whole DE population in one call.
         
-        for i in range(N_obs):
-            x_i, y_i = x_obs[i], y_obs[i]
-
-            l1_distances = np.abs(x_curve - x_i) + np.abs(y_curve - y_i)
+        Args:
+            params: Array of shape (3, S) with rows [theta_deg, m, x]
             
-            #  minimum distance (the closest point error)
-            min_l1_distance = np.min(l1_distances)
+        Returns: Array of shape (S,) with the L1 loss of each parameter set.
+        """
+        if self._t is None:
+            raise ValueError("Data not bound. Call bind() first.")
+        
+        theta_deg, m, x = np.asarray(params).reshape(3, -1)
+        
+        x_curves, y_curves = self.model.predict_batch(self._t, theta_deg, m, x,
+                                                      abs_t=self._abs_t, sin_ft=self._sin_ft)
+        
+        losses = np.empty(x_curves.shape[0])
+        l1_loss_batch(x_curves, y_curves, self._x_obs, self._y_obs, losses)
+        
+        return losses
+    
+    def residuals(self, params: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+        """
+        Per-observation residuals sqrt(min_l1_distance_i + eps) for least_squares.
+        
+        The sum of squared residuals is (N_obs times) the mean L1 loss, up to eps.
+        
+        Args:
+            params: [theta_deg, m, x]
             
-            total_min_l1_distance += min_l1_distance
+        Returns: Array of shape (N_obs,) with one residual per observation.
+        """
+        x_curve, y_curve = self._predict_curve(params)
         
-        # return total_min_l1_distance 
-        return total_min_l1_distance / N_obs
-
+        min_l1_distances = np.empty_like(self._x_obs)
+        l1_min_distances(x_curve, y_curve, self._x_obs, self._y_obs, min_l1_distances)
+        
+        return np.sqrt(min_l1_distances + eps)
@@ -2,19 +2,35 @@
 Optimizer Module -  parameter optimization using global and local methods.
 """
 
+import multiprocessing
+import numba
 import numpy as np
-from scipy.optimize import differential_evolution, least_squares
+from scipy.optimize import differential_evolution, least_squares, minimize
 from typing import Tuple, List, Dict, Any
 from ParametricModel import ParametricModel
 from LossFunction import L1Loss
-from scipy.optimize import minimize
+
+
+# local methods accepted by Optimizer.optimize(refine_method=...)
+_REFINE_METHODS = ('Nelder-Mead', 'least_squares')
+
+# DE search precisions accepted by Optimizer.optimize(de_precision=...)
+_DE_PRECISIONS = ('float32', 'float64')
+
+
+def _init_pool_worker() -> None:
+    """
+    One Numba thread per pool process; the pool already spans all cores.
+    """
+    numba.set_num_threads(1)
+
 
 class Optimizer:
     """
     Optimizer class for parameter estimation.
     
     1. Global optimization with differential evolution
-    2. Local refinement with least squares 
+    2. Local refinement with Nelder-Mead or least squares
     
     """
     
@@ -29,18 +45,43 @@ class Optimizer:
     
     def optimize(self, t: np.ndarray, x_obs: np.ndarray, y_obs: np.ndarray,
                  use_refinement: bool = True,
-                 de_maxiter: int = 2000,
-                 de_popsize: int = 17,
-                 de_tol: float = 1e-6) -> Tuple[float, float, float, float]:
+                 de_maxiter: int = 300,
+                 de_popsize: int = 12,
+                 de_tol: float = 1e-4,
+                 vectorized: bool = True,
+                 de_precision: str = 'float32',
+                 coarse_to_fine: bool = True,
+                 refine_method: str = 'Nelder-Mead') -> Tuple[float, float, float, float]:
         """
         Optimize parameters using differential evolution and refinement.
         
+        With vectorized=True the whole DE population is evaluated in one
+        call per generation (requires SciPy >= 1.9). Otherwise the population
+        is spread over all CPU cores with a process pool; SciPy does not
+        allow both.
+        
+        The DE search runs in de_precision ('float32' by default); the reported
+        losses and the refinement always use float64.
+        
+        With coarse_to_fine=True the first 70% of the DE generations use a t grid
+        at 25% density; the remaining ones continue from that population on the
+        full grid (requires SciPy >= 1.12 for result.population).
+        
+        refine_method is 'Nelder-Mead' (derivative-free, on the true L1 loss)
+        or 'least_squares' (TRF on per-point L1 residuals).
+        
         Returns - Optimized theta, M, X and final L1 loss
     
         """
         
+        # fail before any pool is started or the DE search is run
+        if refine_method not in _REFINE_METHODS:
+            raise ValueError(f"refine_method must be one of {_REFINE_METHODS}, got {refine_method!r}")
+        if de_precision not in _DE_PRECISIONS:
+            raise ValueError(f"de_precision must be one of {_DE_PRECISIONS}, got {de_precision!r}")
+        
         #  parameter range
-        bounds = list(self.model.get_parameter_bounds())
+        bounds = self.model.get_parameter_bounds()
         
         if self.verbose:
             print("\n🔍 Starting global optimization with differential_evolution...")
@@ -48,27 +89,66 @@ class Optimizer:
                   f"M ∈ [{bounds[1][0]}, {bounds[1][1]}], "
                   f"X ∈ [{bounds[2][0]}, {bounds[2][1]}]")
         
-        #  objective function for differential evolution
-        def objective(params):
-            return self.loss.compute(params, t, x_obs, y_obs)
+        #  objective function for differential evolution. Bound methods of
+        #  L1Loss pickle, so the scalar one also works with the process pool.
+        #  compute_batch takes params of shape (3, S) and returns shape (S,)
+        objective = self.loss.compute_batch if vectorized else self.loss.compute
         
-        # Run differential evolution
-        result_de = differential_evolution(
-            objective,
-            bounds,
+        # workers=-1 equivalent: Numba's parallel thread pool is not fork-safe,
+        # so use a spawn-based pool instead of SciPy's default (fork) one, and
+        # keep each process single-threaded to avoid cores x cores threads
+        pool = None if vectorized else multiprocessing.get_context('spawn').Pool(
+            initializer=_init_pool_worker
+        )
+        
+        de_kwargs = dict(
             seed=self.seed,
-            maxiter=de_maxiter,
             popsize=de_popsize,
             atol=de_tol,
             tol=de_tol,
+            # DE's own polish is L-BFGS-B on the search-phase objective (float32,
+            # non-smooth); _refine runs the local step on the float64 loss instead
             polish=False,
             mutation=(0.5, 1),
             recombination=0.9,
-            workers=1
+            workers=1 if pool is None else pool.map,
+            vectorized=vectorized,
+            updating='deferred'
         )
         
+        # Run differential evolution
+        try:
+            init = 'sobol'
+            fine_maxiter = de_maxiter
+            
+            # coarse phase: candidates are far from the optimum, so a sparser
+            # curve ranks them the same at a fraction of the cost
+            if coarse_to_fine:
+                t_coarse = np.linspace(t[0], t[-1], max(len(t) // 4, 2))
+                coarse_maxiter = int(0.7 * de_maxiter)
+                fine_maxiter = de_maxiter - coarse_maxiter
+                
+                self.loss.bind(t_coarse, x_obs, y_obs, precision=de_precision)
+                result_coarse = differential_evolution(
+                    objective, bounds, maxiter=coarse_maxiter, init=init, **de_kwargs
+                )
+                init = result_coarse.population
+            
+            # bind grid and observations once per phase; the hot path only sees params
+            self.loss.bind(t, x_obs, y_obs, precision=de_precision)
+            result_de = differential_evolution(
+                objective, bounds, maxiter=fine_maxiter, init=init, **de_kwargs
+            )
+        finally:
+            if pool is not None:
+                pool.terminate()
+        
         theta_opt, m_opt, x_opt = result_de.x
-        initial_loss = result_de.fun
+        
+        # back to full precision for reporting and refinement
+        if de_precision != 'float64':
+            self.loss.bind(t, x_obs, y_obs, precision='float64')
+        initial_loss = self.loss.compute(result_de.x)
         
         # Store optimization step
         self.optimization_history.append({
@@ -84,10 +164,10 @@ class Optimizer:
             print(f"   Initial parameters: θ = {theta_opt:.6f}°, M = {m_opt:.6f}, X = {x_opt:.6f}")
             print(f"   Initial L1 loss: {initial_loss:.6f}")
         
-        # refinement with least_squares
+        # local refinement
         if use_refinement:
             theta_opt, m_opt, x_opt, final_loss = self._refine(
-                theta_opt, m_opt, x_opt, t, x_obs, y_obs
+                theta_opt, m_opt, x_opt, method=refine_method
             )
         else:
             final_loss = initial_loss
@@ -95,40 +175,57 @@ class Optimizer:
         return theta_opt, m_opt, x_opt, final_loss
     
     def _refine(self, theta_init: float, m_init: float, x_init: float,
-                t: np.ndarray, x_obs: np.ndarray, y_obs: np.ndarray) -> Tuple[float, float, float, float]:
+                method: str = 'Nelder-Mead') -> Tuple[float, float, float, float]:
         """
-        Refine parameters using least squares optimization.
+        Refine parameters with a local optimizer.
+        Expects self.loss to be bound to the data already (see optimize).
       
         Returns - Refined theta, M, X and final L1 loss
         """
+        if method not in _REFINE_METHODS:
+            raise ValueError(f"refine_method must be one of {_REFINE_METHODS}, got {method!r}")
+        
         if self.verbose:
-            print("\n🔧 Refining with minimize (L-BFGS-B) on TRUE L1 Loss...")
-            
-            
+            if method == 'Nelder-Mead':
+                print("\n🔧 Refining with minimize (Nelder-Mead) on TRUE L1 Loss...")
+            else:
+                print("\n🔧 Refining with least_squares (TRF, soft_l1) on per-point L1 residuals...")
+        
+        bounds = self.model.get_parameter_bounds()
+        x0 = [theta_init, m_init, x_init]
+        
+        if method == 'Nelder-Mead':
+            # the closest-point L1 loss is non-smooth, so use a derivative-free
+            # simplex; SciPy's Nelder-Mead clips to bounds natively
+            result = minimize(
+                self.loss.compute,
+                x0,
+                method='Nelder-Mead',
+                bounds=bounds,
+                options={'xatol': 1e-5, 'fatol': 1e-6, 'adaptive': True, 'disp': self.verbose}
+            )
+        else:
+            bounds_arr = self.model.get_parameter_bounds_array()
             
-        def scalar_objective(params):
-            # params is a 1D array: [theta, M, X]
-            return self.loss.compute(params, t, x_obs, y_obs)
-        
-        (theta_min, theta_max), (m_min, m_max), (x_min, x_max) = self.model.get_parameter_bounds()
-        # Bounds format for minimize
-        bounds = ((theta_min, theta_max), (m_min, m_max), (x_min, x_max))
-        
-        # Refining using minimize with L-BFGS-B (suitable for bounded problems)
-        result_min = minimize(
-            scalar_objective,
-            [theta_init, m_init, x_init],
-            method='L-BFGS-B',  # Good choice for bounded scalar minimization
-            bounds=bounds,
-            options={'ftol': 1e-6, 'disp': self.verbose}
-        )
+            # residuals are sqrt of the closest-point L1 distances, so the sum of
+            # squares tracks the L1 loss while TRF can exploit the Jacobian structure
+            result = least_squares(
+                self.loss.residuals,
+                x0,
+                method='trf',
+                loss='soft_l1',
+                x_scale='jac',
+                bounds=(bounds_arr[:, 0], bounds_arr[:, 1]),
+                verbose=1 if self.verbose else 0
+            )
         
-        theta_opt, m_opt, x_opt = result_min.x
-
-        final_loss = result_min.fun
+        theta_opt, m_opt, x_opt = result.x
+        
+        # report the TRUE mean L1 loss, not the least_squares cost
+        final_loss = self.loss.compute(result.x)
         
         self.optimization_history.append({
-            'method': 'L-BFGS-B',
+            'method': method,
             'theta': theta_opt,
             'm': m_opt,
             'x': x_opt,
@@ -2,8 +2,65 @@
 Model Module - has the parametric curve model and prediction methods.
 """
 
+import math
 import numpy as np
-from typing import Tuple
+from numba import njit, prange
+from typing import Optional, Tuple
+
+
+# pi / 180, as a plain Python float (a compile-time constant inside the kernels)
+_DEG2RAD = 0.017453292519943295
+
+
+@njit(cache=True, fastmath=True)
+def _predict_kernel(t, theta_deg, m, x, y_offset, freq, out_x, out_y):
+    """
+    Fused x(t), y(t) evaluation in a single loop with no temporaries.
+    """
+    theta_rad = theta_deg * _DEG2RAD
+    c = math.cos(theta_rad)
+    s = math.sin(theta_rad)
+    
+    for i in range(t.size):
+        ti = t[i]
+        et_st = math.exp(m * abs(ti)) * math.sin(freq * ti)
+        out_x[i] = ti * c - et_st * s + x
+        out_y[i] = y_offset + ti * s + et_st * c
+
+
+@njit(cache=True, fastmath=True)
+def _predict_cached_kernel(t, abs_t, sin_ft, cos_theta, sin_theta, m, x, y_offset, out_x, out_y):
+    """
+    Same as _predict_kernel, with |t|, sin(freq*t), cos(θ) and sin(θ) precomputed
+    by the caller. Arithmetic stays in the dtype of the arrays and scalars passed in.
+    """
+    for i in range(t.size):
+        ti = t[i]
+        et_st = math.exp(m * abs_t[i]) * sin_ft[i]
+        out_x[i] = ti * cos_theta - et_st * sin_theta + x
+        out_y[i] = y_offset + ti * sin_theta + et_st * cos_theta
+
+
+@njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+def _predict_batch_kernel(t, abs_t, sin_ft, cos_theta, sin_theta, m, x, y_offset, out_x, out_y):
+    """
+    Row s of out_x/out_y (shape (S, T)) is the curve for parameter set s, in parallel over S.
+    """
+    for s in prange(cos_theta.size):
+        _predict_cached_kernel(t, abs_t, sin_ft, cos_theta[s], sin_theta[s], m[s], x[s],
+                               y_offset, out_x[s], out_y[s])
+
+
+def _check_out(out: Tuple[np.ndarray, np.ndarray], t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The kernels do not bounds-check, so out buffers must match t exactly.
+    """
+    x_out, y_out = out
+    for buf in (x_out, y_out):
+        if (not isinstance(buf, np.ndarray) or buf.shape != t.shape or buf.dtype != t.dtype
+                or not buf.flags.c_contiguous or not buf.flags.writeable):
+            raise ValueError(f"out buffers must be writable contiguous {t.dtype} arrays of shape {t.shape}")
+    return x_out, y_out
 
 
 class ParametricModel:
@@ -20,31 +77,129 @@ class ParametricModel:
 
         self.y_offset = y_offset
         self.frequency = frequency
+        
+        # parameter ranges, built once and shared by every caller
+        self._bounds_tuple = ((0.0, 50.0), (-0.05, 0.05), (0.0, 100.0))
+        self._bounds_arr = np.array(self._bounds_tuple)
+        self._bounds_arr.flags.writeable = False
     
-    def predict(self, t: np.ndarray, theta_deg: float, m: float, x: float) -> Tuple[np.ndarray, np.ndarray]:
+    def predict(self, t: np.ndarray, theta_deg: float, m: float, x: float,
+                out: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Predict x and y coordinates for given parameters.
         
+        t: scalar or array of any shape; the outputs have the same shape
+           (NumPy scalars for a scalar t)
+        out: optional preallocated (x, y) float64 buffers shaped like t, reused across calls
+        
+        Returns: Predicted x,y coordinates
+        
+        """
+        # not ascontiguousarray: that would turn a scalar t into shape (1,)
+        t = np.asarray(t, dtype=np.float64)
+        if not t.flags.c_contiguous:
+            t = t.copy()
+        
+        if out is None:
+            x_pred, y_pred = np.empty_like(t), np.empty_like(t)
+        else:
+            x_pred, y_pred = _check_out(out, t)
+        
+        # the kernel works on 1-D arrays; ravel of a contiguous array is a view,
+        # so it writes straight into x_pred / y_pred
+        _predict_kernel(t.ravel(), float(theta_deg), float(m), float(x),
+                        float(self.y_offset), float(self.frequency),
+                        x_pred.ravel(), y_pred.ravel())
+        
+        if t.ndim == 0 and out is None:
+            return x_pred[()], y_pred[()]
+        
+        return x_pred, y_pred
+    
+    def predict_cached(self, t: np.ndarray, abs_t: np.ndarray, sin_ft: np.ndarray,
+                       theta_deg: float, m: float, x: float,
+                       out: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fast path of predict for a fixed t grid.
+        
+        t, abs_t, sin_ft: contiguous float32 or float64 arrays of one shape and dtype,
+                          with abs_t = np.abs(t) and sin_ft = np.sin(frequency * t)
+        out: optional preallocated (x, y) buffers like t, reused across calls
+        
+        Computation runs in the dtype of t.
+        
         Returns: Predicted x,y coordinates
         
         """
+        for arr in (t, abs_t, sin_ft):
+            if (not isinstance(arr, np.ndarray) or arr.dtype not in (np.float32, np.float64)
+                    or not arr.flags.c_contiguous):
+                raise ValueError("t, abs_t and sin_ft must be contiguous float32 or float64 arrays")
+        if abs_t.shape != t.shape or sin_ft.shape != t.shape or abs_t.dtype != t.dtype or sin_ft.dtype != t.dtype:
+            raise ValueError("abs_t and sin_ft must have the same shape and dtype as t")
+        
+        if out is None:
+            x_pred, y_pred = np.empty_like(t), np.empty_like(t)
+        else:
+            x_pred, y_pred = _check_out(out, t)
+        
+        theta_rad = float(theta_deg) * _DEG2RAD
+        cast = t.dtype.type
+        _predict_cached_kernel(t, abs_t, sin_ft, cast(math.cos(theta_rad)), cast(math.sin(theta_rad)),
+                               cast(m), cast(x), cast(self.y_offset), x_pred, y_pred)
+        
+        return x_pred, y_pred
+    
+    def predict_batch(self, t: np.ndarray, theta_deg: np.ndarray, m: np.ndarray, x: np.ndarray,
+                      abs_t: Optional[np.ndarray] = None,
+                      sin_ft: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict x and y coordinates for S parameter sets at once.
+        
+        theta_deg, m, x: arrays of shape (S,)
+        abs_t, sin_ft: optional precomputed np.abs(t) and np.sin(frequency * t),
+                       same shape and dtype as t
+        
+        t must be 1-D (shape (T,)); ValueError otherwise. float32 and float64 t
+        are computed in their own dtype; any other t is converted to float64,
+        as in predict.
         
-        # degrees to radians
-        theta_rad = np.deg2rad(theta_deg)
+        Returns: Predicted x,y coordinates, each of shape (S, T)
         
-        # trigonometric values
-        cos_theta = np.cos(theta_rad)
-        sin_theta = np.sin(theta_rad)
+        """
+        t = np.asarray(t)
+        if t.ndim != 1:
+            raise ValueError(f"predict_batch needs a 1-D t grid, got shape {t.shape}")
+        if t.dtype not in (np.float32, np.float64):
+            t = t.astype(np.float64)
+        t = np.ascontiguousarray(t)
+        dtype = t.dtype
         
-        exp_term = np.exp(m * np.abs(t))
+        # t-only terms are computed in float64 and then cast, like L1Loss.bind
+        if abs_t is None:
+            abs_t = np.abs(t)
+        if sin_ft is None:
+            sin_ft = np.sin(self.frequency * t.astype(np.float64)).astype(dtype)
+        for arr in (abs_t, sin_ft):
+            if (not isinstance(arr, np.ndarray) or arr.shape != t.shape or arr.dtype != dtype
+                    or not arr.flags.c_contiguous):
+                raise ValueError("abs_t and sin_ft must be contiguous arrays with the same shape and dtype as t")
         
-        sin_freq_t = np.sin(self.frequency * t)
+        # per-parameter-set terms are computed once here (cos/sin in float64,
+        # like predict_cached); the kernel fuses the rest
+        theta_rad = np.asarray(theta_deg, dtype=np.float64).reshape(-1) * _DEG2RAD
+        cos_theta = np.cos(theta_rad).astype(dtype)
+        sin_theta = np.sin(theta_rad).astype(dtype)
+        m = np.ascontiguousarray(m, dtype=dtype).reshape(-1)
+        x = np.ascontiguousarray(x, dtype=dtype).reshape(-1)
+        if not (m.size == x.size == cos_theta.size):
+            raise ValueError("theta_deg, m and x must have the same length")
         
-        #  x(t)
-        x_pred = t * cos_theta - exp_term * sin_freq_t * sin_theta + x
+        x_pred = np.empty((cos_theta.size, t.size), dtype=dtype)
+        y_pred = np.empty_like(x_pred)
         
-        #  y(t)
-        y_pred = self.y_offset + t * sin_theta + exp_term * sin_freq_t * cos_theta
+        _predict_batch_kernel(t, abs_t, sin_ft, cos_theta, sin_theta, m, x,
+                              dtype.type(self.y_offset), x_pred, y_pred)
         
         return x_pred, y_pred
     
@@ -55,7 +210,16 @@ class ParametricModel:
         Returns - (theta_min, theta_max), (m_min, m_max), (x_min, x_max))
         
         """
-        return ((0.0, 50.0), (-0.05, 0.05), (0.0, 100.0))
+        return self._bounds_tuple
+    
+    def get_parameter_bounds_array(self) -> np.ndarray:
+        """
+        Get given range for unknown params as a read-only array
+        
+        Returns - array of shape (3, 2), rows [min, max] for theta, m, x
+        
+        """
+        return self._bounds_arr
     
     def validate_parameters(self, theta_deg: float, m: float, x: float) -> bool:
         """
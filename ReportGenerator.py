@@ -1,3 +1,6 @@
+import io
+
+
 class ReportGenerator:
     def __init__(self, precision: int = 6):
 
@@ -58,39 +61,37 @@ LaTeX submission:
                         theta_opt: float, m_opt: float, x_opt: float,
                         final_loss: float) -> str:
 
-        summary_lines = [
-            "="*60,
-            "OPTIMIZATION SUMMARY",
-            "="*60,
-            "",
-            "Data Summary:",
-            f"  Number of points: {data_summary['n_points']}",
-            f"  X range: [{data_summary['x_range'][0]:.2f}, {data_summary['x_range'][1]:.2f}]",
-            f"  Y range: [{data_summary['y_range'][0]:.2f}, {data_summary['y_range'][1]:.2f}]",
-            f"  t range: [{data_summary['t_range'][0]}, {data_summary['t_range'][1]}]",
-            "",
-            "Optimization Steps:",
-        ]
+        p = self.precision
+        buf = io.StringIO()
+        
+        buf.write("=" * 60 + "\n")
+        buf.write("OPTIMIZATION SUMMARY\n")
+        buf.write("=" * 60 + "\n")
+        buf.write("\n")
+        buf.write("Data Summary:\n")
+        buf.write(f"  Number of points: {data_summary['n_points']}\n")
+        buf.write(f"  X range: [{data_summary['x_range'][0]:.2f}, {data_summary['x_range'][1]:.2f}]\n")
+        buf.write(f"  Y range: [{data_summary['y_range'][0]:.2f}, {data_summary['y_range'][1]:.2f}]\n")
+        buf.write(f"  t range: [{data_summary['t_range'][0]}, {data_summary['t_range'][1]}]\n")
+        buf.write("\n")
+        buf.write("Optimization Steps:\n")
         
         for i, step in enumerate(optimization_history):
-            summary_lines.append(
+            buf.write(
                 f"  Step {i+1} ({step['method']}): "
-                f"θ={step['theta']:.{self.precision}f}°, "
-                f"M={step['m']:.{self.precision}f}, "
-                f"X={step['x']:.{self.precision}f}, "
-                f"Loss={step['loss']:.{self.precision}f}"
+                f"θ={step['theta']:.{p}f}°, "
+                f"M={step['m']:.{p}f}, "
+                f"X={step['x']:.{p}f}, "
+                f"Loss={step['loss']:.{p}f}\n"
             )
         
-        summary_lines.extend([
-            "",
-            "Final Results:",
-            f"  θ = {theta_opt:.{self.precision}f} degrees",
-            f"  M = {m_opt:.{self.precision}f}",
-            f"  X = {x_opt:.{self.precision}f}",
-            f"  Final L1 Loss = {final_loss:.{self.precision}f}",
-            "",
-            "="*60
-        ])
+        buf.write("\n")
+        buf.write("Final Results:\n")
+        buf.write(f"  θ = {theta_opt:.{p}f} degrees\n")
+        buf.write(f"  M = {m_opt:.{p}f}\n")
+        buf.write(f"  X = {x_opt:.{p}f}\n")
+        buf.write(f"  Final L1 Loss = {final_loss:.{p}f}\n")
+        buf.write("\n")
+        buf.write("=" * 60)
         
-        return "\n".join(summary_lines)
-
+        return buf.getvalue()
@@ -17,8 +17,8 @@ def main():
     # Run optimization
     curve_fitter.run(
         use_refinement=True,
-        de_maxiter=500,
-        de_popsize=10,
+        de_maxiter=300,
+        de_popsize=12,
         de_tol=1e-4
     )
     